@@ -278,7 +278,10 @@ export function getSatellitePosition(engine: SkyEngine, index: number): {
 
 /**
  * Load satellite ephemeris data from a binary file.
- * Format: [count: u32] followed by [jd: f64, x: f64, y: f64, z: f64] per point.
+ * Format (see `SatelliteEphemeris::from_binary`): a 16-byte header — [0: u32]
+ * ["OAEP"] [count: u32] [flags: u8] [3 reserved bytes] — then the columns
+ * jd[count] (f64), x[count], y[count], z[count] (f64, or f32 with flag 0x01).
+ * Legacy files ([count: u32] then [jd, x, y, z] f64 records) still load.
  * @param engine - The SkyEngine instance
  * @param index - Satellite index (SATELLITE_ISS, SATELLITE_HUBBLE, etc.)
  * @param url - URL to the ephemeris binary file
@@ -333,7 +336,7 @@ export function getISSBuffer(engine: SkyEngine): Float32Array {
 
 /**
  * Load ISS ephemeris data from a binary file.
- * Format: [count: u32] followed by [jd: f64, x: f64, y: f64, z: f64] per point.
+ * Format: see loadSatelliteEphemeris().
  * @deprecated Use loadSatelliteEphemeris() instead
  */
 export async function loadISSEphemeris(engine: SkyEngine, url: string): Promise<boolean> {
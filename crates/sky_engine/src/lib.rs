@@ -736,7 +736,8 @@ impl SkyEngine {
     }
 
     /// Load satellite ephemeris from binary data.
-    /// Format: [count: u32] followed by [jd: f64, x: f64, y: f64, z: f64] for each point.
+    /// Format: see `SatelliteEphemeris::from_binary` (16-byte header, then jd, x, y, z
+    /// columns; legacy [count: u32] + f64 [jd, x, y, z] records are also accepted).
     /// Call recompute() after loading to update satellite position.
     pub fn load_satellite_ephemeris(&mut self, index: usize, data: &[u8]) -> Result<(), JsError> {
         let id = SatelliteId::from_index(index)
@@ -831,7 +832,8 @@ impl SkyEngine {
     // --- Legacy ISS buffer accessors (for backwards compatibility) ---
 
     /// Load ISS ephemeris from binary data (legacy - use load_satellite_ephemeris).
-    /// Format: [count: u32] followed by [jd: f64, x: f64, y: f64, z: f64] for each point.
+    /// Format: see `SatelliteEphemeris::from_binary` (16-byte header, then jd, x, y, z
+    /// columns; legacy [count: u32] + f64 [jd, x, y, z] records are also accepted).
     /// Call recompute() after loading to update ISS position.
     pub fn load_iss_ephemeris(&mut self, data: &[u8]) -> Result<(), JsError> {
         self.load_satellite_ephemeris(SatelliteId::ISS.index(), data)
@@ -136,10 +136,16 @@ struct Sample {
 /// Read the sample times out of the committed binary.
 ///
 /// Format (see `scripts/generate_satellite_ephemeris.py` and
-/// `SatelliteEphemeris::from_binary`): a `u32` count followed by that many
-/// `(jd, x_km, y_km, z_km)` little-endian `f64` records. Only the time tags are
-/// taken from here; the positions are read back through the production
-/// `SatelliteEphemeris` path so this test also covers that parser.
+/// `SatelliteEphemeris::from_binary`): a 16-byte header (a zero `u32`, the
+/// magic `OAEP`, a `u32` count, a flags byte, 3 reserved bytes), then either
+/// columns `jd[count]`, `x[count]`, `y[count]`, `z[count]` (flag `0x02`, what
+/// the generator writes) or one `(jd, x_km, y_km, z_km)` record per point.
+/// `jd` is always `f64`; positions are `f64`, or `f32` with flag `0x01`.
+/// Files written before the header existed (like the committed fixture) are a
+/// bare `u32` count followed by `f64` records. All values are little-endian.
+/// Only the time tags are taken from here; the positions are read back
+/// through the production `SatelliteEphemeris` path so this test also covers
+/// that parser.
 ///
 /// **This deliberately re-implements the header/record layout instead of
 /// reading the times back off `SatelliteEphemeris`.** Duplicating a binary
@@ -147,24 +153,42 @@ struct Sample {
 /// give the Horizons pipeline a second, independent opinion, and a test that
 /// took both its times *and* its positions from `from_binary` could no longer
 /// notice that parser misreading the file — it would agree with itself. The
-/// count check below plus `assert_eq!(ephemeris.len(), sample_times.len())` in
+/// size check below plus `assert_eq!(ephemeris.len(), sample_times.len())` in
 /// [`horizons_samples`] are the cross-check. If the on-disk format ever
 /// changes, this parser is *supposed* to fail until it is updated in step.
 fn read_sample_times(bytes: &[u8]) -> Vec<f64> {
     assert!(bytes.len() >= 4, "ephemeris fixture is truncated");
-    let count = u32::from_le_bytes([bytes[0], bytes[1], bytes[2], bytes[3]]) as usize;
+    let read_u32 = |at: usize| u32::from_le_bytes(bytes[at..at + 4].try_into().unwrap());
+
+    // (count, header length, columnar, bytes per position component)
+    let (count, header_len, columnar, pos_width) =
+        if read_u32(0) == 0 && bytes.len() >= 16 && &bytes[4..8] == b"OAEP" {
+            let flags = bytes[12];
+            assert_eq!(
+                flags & !0x03,
+                0,
+                "ephemeris fixture has unknown format flags"
+            );
+            let pos_width = if flags & 0x01 != 0 { 4 } else { 8 };
+            (read_u32(8) as usize, 16, flags & 0x02 != 0, pos_width)
+        } else {
+            (read_u32(0) as usize, 4, false, 8)
+        };
+    let record_len = 8 + 3 * pos_width;
     assert_eq!(
         bytes.len(),
-        4 + count * 32,
+        header_len + count * record_len,
         "ephemeris fixture size does not match its header count"
     );
 
     (0..count)
         .map(|i| {
-            let offset = 4 + i * 32;
-            let mut jd = [0u8; 8];
-            jd.copy_from_slice(&bytes[offset..offset + 8]);
-            f64::from_le_bytes(jd)
+            let offset = if columnar {
+                header_len + i * 8
+            } else {
+                header_len + i * record_len
+            };
+            f64::from_le_bytes(bytes[offset..offset + 8].try_into().unwrap())
         })
         .collect()
 }
@@ -63,6 +63,34 @@ impl SatelliteId {
     }
 }
 
+/// Magic bytes identifying the current satellite ephemeris header. They
+/// follow a zero u32 in the slot where legacy files keep their point count,
+/// so loaders that predate the header read a new file as an empty ephemeris
+/// (and report it as out of date) rather than misparsing it.
+pub const EPHEMERIS_MAGIC: [u8; 4] = *b"OAEP";
+
+/// Header length: zero u32, magic, count (u32), format flags (u8), 3
+/// reserved bytes. A multiple of 8, so f64 data after it stays aligned.
+const EPHEMERIS_HEADER_LEN: usize = 16;
+
+/// Ephemeris format flag: x, y, z are stored as f32 instead of f64.
+///
+/// At ISS/Hubble radii (~7000 km) an f32 resolves ~0.5 m, far below the
+/// error of the predicted trajectory itself; the JD always stays f64.
+pub const EPHEMERIS_F32_POSITIONS: u8 = 0x01;
+
+/// Ephemeris format flag: columnar layout (all JDs, then all x, all y, all z)
+/// instead of one record per point, so time lookups touch only the JD column.
+pub const EPHEMERIS_SOA: u8 = 0x02;
+
+fn read_f64_le(bytes: &[u8], offset: usize) -> f64 {
+    f64::from_le_bytes(bytes[offset..offset + 8].try_into().unwrap())
+}
+
+fn read_f32_le(bytes: &[u8], offset: usize) -> f32 {
+    f32::from_le_bytes(bytes[offset..offset + 4].try_into().unwrap())
+}
+
 /// A single ephemeris point for a satellite.
 /// Contains position in ECI (Earth-Centered Inertial) J2000 coordinates.
 #[derive(Debug, Clone, Copy)]
@@ -94,73 +122,76 @@ impl SatelliteEphemeris {
         Self { id, points }
     }
 
-    /// Create from binary data.
-    /// Format: [count: u32] followed by [jd: f64, x: f64, y: f64, z: f64] for each point.
+    /// Create from binary data (written by `scripts/generate_satellite_ephemeris.py`).
+    ///
+    /// Format: [0: u32][magic: 4 bytes = [`EPHEMERIS_MAGIC`]][count: u32]
+    /// [format flags: u8][3 reserved bytes], then the point data, all
+    /// little-endian. With [`EPHEMERIS_SOA`] set (what the generator writes)
+    /// that is four contiguous columns: jd[count], x[count], y[count],
+    /// z[count]; otherwise one [jd, x, y, z] record per point. jd is always
+    /// f64; x, y, z are f64, or f32 when [`EPHEMERIS_F32_POSITIONS`] is set.
+    ///
+    /// Files written before the header existed start with a nonzero count
+    /// followed directly by f64 [jd, x, y, z] records.
     pub fn from_binary(id: SatelliteId, data: &[u8]) -> Result<Self, &'static str> {
         if data.len() < 4 {
             return Err("Satellite ephemeris data too short");
         }
 
-        let count = u32::from_le_bytes([data[0], data[1], data[2], data[3]]) as usize;
-        let expected_len = 4 + count * 32; // 4 bytes header + 32 bytes per point (4 f64s)
+        let read_u32 = |at: usize| u32::from_le_bytes(data[at..at + 4].try_into().unwrap());
+        let (count, flags, offset) = if read_u32(0) == 0
+            && data.len() >= EPHEMERIS_HEADER_LEN
+            && data[4..8] == EPHEMERIS_MAGIC
+        {
+            (read_u32(8) as usize, data[12], EPHEMERIS_HEADER_LEN)
+        } else {
+            (read_u32(0) as usize, 0, 4)
+        };
 
-        if data.len() < expected_len {
-            return Err("Satellite ephemeris data truncated");
+        if flags & !(EPHEMERIS_F32_POSITIONS | EPHEMERIS_SOA) != 0 {
+            return Err("Unknown satellite ephemeris format");
         }
+        let f32_positions = flags & EPHEMERIS_F32_POSITIONS != 0;
+        let soa = flags & EPHEMERIS_SOA != 0;
+        let pos_width = if f32_positions { 4 } else { 8 };
+        let record_len = 8 + 3 * pos_width;
+
+        count
+            .checked_mul(record_len)
+            .and_then(|n| n.checked_add(offset))
+            .filter(|&end| end <= data.len())
+            .ok_or("Satellite ephemeris data truncated")?;
+
+        let read_pos = |at: usize| {
+            if f32_positions {
+                read_f32_le(data, at) as f64
+            } else {
+                read_f64_le(data, at)
+            }
+        };
 
-        let mut points = Vec::with_capacity(count);
-        let mut offset = 4;
-
-        for _ in 0..count {
-            let jd = f64::from_le_bytes([
-                data[offset],
-                data[offset + 1],
-                data[offset + 2],
-                data[offset + 3],
-                data[offset + 4],
-                data[offset + 5],
-                data[offset + 6],
-                data[offset + 7],
-            ]);
-            let x_km = f64::from_le_bytes([
-                data[offset + 8],
-                data[offset + 9],
-                data[offset + 10],
-                data[offset + 11],
-                data[offset + 12],
-                data[offset + 13],
-                data[offset + 14],
-                data[offset + 15],
-            ]);
-            let y_km = f64::from_le_bytes([
-                data[offset + 16],
-                data[offset + 17],
-                data[offset + 18],
-                data[offset + 19],
-                data[offset + 20],
-                data[offset + 21],
-                data[offset + 22],
-                data[offset + 23],
-            ]);
-            let z_km = f64::from_le_bytes([
-                data[offset + 24],
-                data[offset + 25],
-                data[offset + 26],
-                data[offset + 27],
-                data[offset + 28],
-                data[offset + 29],
-                data[offset + 30],
-                data[offset + 31],
-            ]);
-
-            points.push(SatelliteEphemerisPoint {
-                jd,
-                x_km,
-                y_km,
-                z_km,
-            });
-            offset += 32;
-        }
+        let points = (0..count)
+            .map(|i| {
+                // Byte offsets of this point's jd and x, and the distance
+                // from x to y (and y to z), in either layout.
+                let (jd_at, x_at, axis_stride) = if soa {
+                    (
+                        offset + 8 * i,
+                        offset + 8 * count + pos_width * i,
+                        pos_width * count,
+                    )
+                } else {
+                    let record = offset + record_len * i;
+                    (record, record + 8, pos_width)
+                };
+                SatelliteEphemerisPoint {
+                    jd: read_f64_le(data, jd_at),
+                    x_km: read_pos(x_at),
+                    y_km: read_pos(x_at + axis_stride),
+                    z_km: read_pos(x_at + 2 * axis_stride),
+                }
+            })
+            .collect();
 
         Ok(Self::new(id, points))
     }
@@ -800,6 +831,112 @@ mod tests {
         assert!(pos.2.abs() < 1.0);
     }
 
+    /// Current-format header for `count` points with the given flags.
+    fn ephemeris_header(count: u32, flags: u8) -> Vec<u8> {
+        let mut data = Vec::new();
+        data.extend_from_slice(&0u32.to_le_bytes());
+        data.extend_from_slice(&EPHEMERIS_MAGIC);
+        data.extend_from_slice(&count.to_le_bytes());
+        data.extend_from_slice(&[flags, 0, 0, 0]);
+        data
+    }
+
+    #[test]
+    fn test_ephemeris_binary_format_with_header() {
+        // Interleaved f64 records after the header, same two points as above.
+        let mut data = ephemeris_header(2, 0);
+        for (jd, x, y) in [(2460000.0f64, 6800.0f64, 0.0f64), (2460001.0, 0.0, 6800.0)] {
+            data.extend_from_slice(&jd.to_le_bytes());
+            data.extend_from_slice(&x.to_le_bytes());
+            data.extend_from_slice(&y.to_le_bytes());
+            data.extend_from_slice(&0.0f64.to_le_bytes());
+        }
+
+        let eph = SatelliteEphemeris::from_binary(SatelliteId::ISS, &data).unwrap();
+        assert_eq!(eph.len(), 2);
+        assert_eq!(eph.time_range(), Some((2460000.0, 2460001.0)));
+    }
+
+    #[test]
+    fn test_ephemeris_binary_format_f32_positions() {
+        let mut data = ephemeris_header(2, EPHEMERIS_F32_POSITIONS);
+        for (jd, x, y) in [
+            (2460000.0f64, 6800.25f32, 0.0f32),
+            (2460001.0, 0.0, 6800.25),
+        ] {
+            data.extend_from_slice(&jd.to_le_bytes());
+            data.extend_from_slice(&x.to_le_bytes());
+            data.extend_from_slice(&y.to_le_bytes());
+            data.extend_from_slice(&0.0f32.to_le_bytes());
+        }
+        assert_eq!(data.len(), 16 + 2 * 20);
+
+        let eph = SatelliteEphemeris::from_binary(SatelliteId::ISS, &data).unwrap();
+        assert_eq!(eph.len(), 2);
+        let pos = eph.interpolate(2460000.0).unwrap();
+        assert!((pos.0 - 6800.25).abs() < 1e-9);
+
+        // Unknown flags and short payloads are rejected rather than misread.
+        let mut unknown = data.clone();
+        unknown[12] = 0x80;
+        assert!(SatelliteEphemeris::from_binary(SatelliteId::ISS, &unknown).is_err());
+        assert!(
+            SatelliteEphemeris::from_binary(SatelliteId::ISS, &data[..data.len() - 1]).is_err()
+        );
+    }
+
+    #[test]
+    fn test_ephemeris_binary_format_soa() {
+        // Columnar layout with f32 positions: jd[2] (f64), then x[2], y[2], z[2] (f32).
+        let mut data = ephemeris_header(2, EPHEMERIS_SOA | EPHEMERIS_F32_POSITIONS);
+        for jd in [2460000.0f64, 2460001.0] {
+            data.extend_from_slice(&jd.to_le_bytes());
+        }
+        for v in [6800.0f32, 0.0, 0.0, 6800.0, 0.0, 0.0] {
+            data.extend_from_slice(&v.to_le_bytes());
+        }
+        assert_eq!(data.len(), 16 + 2 * 20);
+
+        let eph = SatelliteEphemeris::from_binary(SatelliteId::ISS, &data).unwrap();
+        assert_eq!(eph.time_range(), Some((2460000.0, 2460001.0)));
+        // Same midpoint check as the interleaved test: (3400, 3400, 0).
+        let pos = eph.interpolate(2460000.5).unwrap();
+        assert!((pos.0 - 3400.0).abs() < 1.0);
+        assert!((pos.1 - 3400.0).abs() < 1.0);
+        assert!(pos.2.abs() < 1.0);
+    }
+
+    #[test]
+    fn test_ephemeris_header_reads_as_empty_to_legacy_loaders() {
+        // A current-format file as the generator writes it: two points,
+        // columnar f64.
+        let mut data = ephemeris_header(2, EPHEMERIS_SOA);
+        for v in [2460000.0f64, 2460001.0, 6800.0, 0.0, 0.0, 6800.0, 0.0, 0.0] {
+            data.extend_from_slice(&v.to_le_bytes());
+        }
+
+        // The pre-header loader (still running in cached app builds): the
+        // leading u32 is the point count, the file must hold at least
+        // `4 + 32 * count` bytes, and records follow at offset 4.
+        let legacy_parse = |data: &[u8]| -> Result<Vec<[f64; 4]>, &'static str> {
+            let count = u32::from_le_bytes(data[0..4].try_into().unwrap()) as usize;
+            if data.len() < 4 + count * 32 {
+                return Err("Satellite ephemeris data truncated");
+            }
+            Ok((0..count)
+                .map(|i| std::array::from_fn(|k| read_f64_le(data, 4 + 32 * i + 8 * k)))
+                .collect())
+        };
+
+        assert_eq!(legacy_parse(&data), Ok(Vec::new()));
+        assert_eq!(
+            SatelliteEphemeris::from_binary(SatelliteId::ISS, &data)
+                .unwrap()
+                .len(),
+            2
+        );
+    }
+
     /// Sun along +X at a representative Earth-Sun distance.
     const TEST_SUN: (f64, f64, f64) = (149_000_000.0, 0.0, 0.0);
 
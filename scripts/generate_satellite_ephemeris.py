@@ -15,34 +15,101 @@ Options:
     --start DATE      Start date (YYYY-MM-DD), default: today
     --end DATE        End date (YYYY-MM-DD), default: 30 days from start
     --step MINUTES    Time step in minutes, default: 1
+    --verify-only     Verify the existing --output file instead of fetching
+    --verify-all      Check every written point, not just the first and last
+    --fp32-pos        Store positions as f32 (20 bytes/point instead of 32)
+    --cache           Reuse parsed results cached under ~/.cache/once-around/ by
+                      an identical earlier run, and cache new ones. Off by
+                      default: entries never expire, and Horizons revises its
+                      predicted trajectories between pulls
     --output FILE     Output file path, default: data/<satellite>_ephemeris.bin
 
 Requirements:
     - Python 3.8+ (uses only standard library)
 
 The output binary format is:
-    - Header: count (4 bytes, u32 little-endian)
-    - Per point: jd (8 bytes, f64), x_km (8 bytes, f64),
-                 y_km (8 bytes, f64), z_km (8 bytes, f64)
+    - Header (16 bytes): a zero u32, the magic b"OAEP", count (u32), format
+      flags (u8), 3 reserved zero bytes
+    - Then four contiguous columns of count values each (format flag 0x02):
+      jd[] (f64), x_km[], y_km[], z_km[] (f64; f32 with --fp32-pos, flag 0x01)
     - All values are little-endian
+
+The zero u32 sits where files written before the header existed keep their
+point count, so loaders that predate it see an empty ephemeris instead of
+misreading the columns. Readers still accept those legacy files (a bare
+4-byte count and f64 (jd, x, y, z) records), as well as interleaved records
+under the current header (flag 0x02 clear).
 """
 
 import argparse
+import base64
+import gzip
+import hashlib
+import http.client
 import json
+import math
+import mmap
+import os
 import re
+import ssl
 import struct
 import sys
+import tempfile
+import threading
 import time
-import urllib.error
-import urllib.request
 import urllib.parse
+import urllib.request
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO, Optional
 
 
 # NASA Horizons API endpoint
 HORIZONS_API_URL = "https://ssd.jpl.nasa.gov/api/horizons.api"
 
+# Horizons truncates very large vector tables, so longer windows are split
+# into sub-queries of at most this many points, fetched a few at a time.
+MAX_POINTS_PER_QUERY = 50000
+MAX_CONCURRENT_QUERIES = 4
+
+# Binary layout (see module docstring), compiled once for the writer/reader.
+_LEGACY_HEADER = struct.Struct("<I")
+_HEADER = struct.Struct("<I4sIB3x")
+_POINT = struct.Struct("<dddd")
+_POINT_F32 = struct.Struct("<dfff")
+
+# Follows the zero u32 that opens the current header; see module docstring.
+FORMAT_MAGIC = b"OAEP"
+
+# Format flag: positions stored as f32. At ISS/Hubble radii (~7000 km) an f32
+# resolves ~0.5 m, far below Horizons' own prediction error, while JD stays
+# f64 because f32 would only resolve it to ~0.25 day.
+FORMAT_F32_POSITIONS = 0x01
+# Format flag: columnar layout, so time-only scans (e.g. a binary search on
+# JD) touch just the jd[] column. With the 16-byte header every f64 column
+# starts 8-byte aligned.
+FORMAT_SOA = 0x02
+
+# Allowed deviation of a JD step from step_minutes, in days (~9 ms). Horizons
+# prints JDs to 1e-9 day, so genuine samples sit well inside it.
+JD_STEP_TOLERANCE = 1e-7
+
+# One or more blank (or whitespace-only) lines inside a CSV block.
+_BLANK_LINE = re.compile(r"\n\s*\n")
+
+# Equatorial Earth radius used to turn geocentric radius into altitude.
+EARTH_RADIUS_KM = 6378
+
+# Where parsed Horizons results are cached between runs (with --cache).
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "once-around"
+
+# Per-thread keep-alive connections (see _connection), tracked for closing.
+_thread_state = threading.local()
+_open_connections: list[http.client.HTTPSConnection] = []
+_open_connections_lock = threading.Lock()
+
 # Satellite definitions: name -> (horizons_id, display_name, orbital_altitude_km)
 SATELLITES = {
     "iss": ("-125544", "ISS (International Space Station)", 420),
@@ -50,6 +117,50 @@ SATELLITES = {
 }
 
 
+def _connection(host: str) -> http.client.HTTPSConnection:
+    """Return this thread's keep-alive HTTPS connection to host.
+
+    Sub-queries, clamp refetches and retries all go to the same host, so
+    each worker thread keeps one connection open and skips the TCP/TLS
+    handshake on every request after its first. If an HTTPS proxy is
+    configured (HTTPS_PROXY / https_proxy, honoring NO_PROXY, as urllib
+    does), the connection tunnels through it with CONNECT.
+    """
+    conn = getattr(_thread_state, "conn", None)
+    if conn is None or _thread_state.host != host:
+        context = ssl.create_default_context()
+        proxy = urllib.request.getproxies().get("https")
+        if proxy and not urllib.request.proxy_bypass(host):
+            # Proxies are often given bare, e.g. "proxy.example:3128".
+            if "://" not in proxy:
+                proxy = f"http://{proxy}"
+            proxy_url = urllib.parse.urlsplit(proxy)
+            conn = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port or 80,
+                                               timeout=300, context=context)
+            tunnel_headers = {}
+            if proxy_url.username:
+                credentials = (f"{urllib.parse.unquote(proxy_url.username)}:"
+                               f"{urllib.parse.unquote(proxy_url.password or '')}")
+                tunnel_headers["Proxy-Authorization"] = (
+                    "Basic " + base64.b64encode(credentials.encode()).decode("ascii"))
+            conn.set_tunnel(host, headers=tunnel_headers)
+        else:
+            conn = http.client.HTTPSConnection(host, timeout=300, context=context)
+        _thread_state.conn = conn
+        _thread_state.host = host
+        with _open_connections_lock:
+            _open_connections.append(conn)
+    return conn
+
+
+def _close_connections() -> None:
+    """Close every connection opened by _connection()."""
+    with _open_connections_lock:
+        for conn in _open_connections:
+            conn.close()
+        _open_connections.clear()
+
+
 def _fetch_json(url: str) -> dict:
     """GET a Horizons API URL and return parsed JSON, retrying on timeouts.
 
@@ -57,39 +168,181 @@ def _fetch_json(url: str) -> dict:
     1-min steps is ~65k rows) and times out sporadically from CI runners,
     so allow a generous timeout and retry with backoff.
     """
-    req = urllib.request.Request(url)
-    req.add_header("User-Agent", "once-around-satellite-ephemeris/1.0")
+    parts = urllib.parse.urlsplit(url)
+    target = f"{parts.path}?{parts.query}"
+    headers = {
+        "User-Agent": "once-around-satellite-ephemeris/1.0",
+        # Vector tables are highly repetitive text; gzip cuts the transfer
+        # several-fold when the server honors it.
+        "Accept-Encoding": "gzip",
+    }
 
     attempts = 3
     for attempt in range(1, attempts + 1):
+        conn = _connection(parts.netloc)
         try:
-            with urllib.request.urlopen(req, timeout=300) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except (urllib.error.URLError, TimeoutError) as e:
+            conn.request("GET", target, headers=headers)
+            response = conn.getresponse()
+            if response.status != 200:
+                response.read()
+                raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+            if response.getheader("Content-Encoding") == "gzip":
+                with gzip.GzipFile(fileobj=response) as body:
+                    data = json.load(body)
+            else:
+                data = json.load(response)
+            # Drain anything left so the connection can carry the next request.
+            response.read()
+            return data
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
             if attempt == attempts:
-                raise
-            wait_s = 30 * attempt
+                raise RuntimeError(f"Horizons request failed after {attempts} attempts: {e}") from e
+            # A kept-alive connection the server has since dropped is not a
+            # Horizons failure; reconnect straight away.
+            wait_s = 0 if isinstance(e, http.client.RemoteDisconnected) else 30 * attempt
             print(f"Horizons request failed ({e}); retrying in {wait_s}s "
                   f"(attempt {attempt}/{attempts})...")
             time.sleep(wait_s)
 
 
+def _query_horizons(params: dict) -> dict:
+    """Run a Horizons API query with the given parameters."""
+    return _fetch_json(f"{HORIZONS_API_URL}?{urllib.parse.urlencode(params)}")
+
+
+def _cache_path(cache_dir: Path, params: dict) -> Path:
+    """Cache file for a query, keyed by a hash of its parameters."""
+    key = hashlib.sha256(repr(sorted(params.items())).encode()).hexdigest()
+    return cache_dir / f"{key}.bin"
+
+
+def _load_cached_vectors(params: dict, cache_dir: Optional[Path]) -> Optional[tuple[array, array]]:
+    """Return the cached (jd, pos) for a query, or None on a cache miss.
+
+    An entry that cannot be read (damaged, or written in an older format)
+    is deleted and treated as a miss, so the query is simply refetched.
+    """
+    if cache_dir is None:
+        return None
+    cache_path = _cache_path(cache_dir, params)
+    if not cache_path.exists():
+        return None
+    try:
+        return read_binary_ephemeris(cache_path)
+    except RuntimeError as e:
+        print(f"Discarding unreadable cache entry {cache_path.name} ({e})")
+        cache_path.unlink(missing_ok=True)
+        return None
+
+
+def _store_cached_vectors(params: dict, cache_dir: Optional[Path], jd: array, pos: array) -> None:
+    """
+    Cache the parsed (jd, pos) for a query under cache_dir.
+
+    Entries use the same binary format as the output file, so a cache hit
+    skips both the network and parse_vectors(). Only successfully parsed
+    results are stored: an error response (e.g. the prediction cutoff, which
+    moves as Horizons updates its trajectories) is always re-queried.
+    """
+    if cache_dir is None:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file and rename so an interrupted run never leaves
+    # a truncated cache entry behind.
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            _write_ephemeris(f, jd, pos)
+        os.replace(tmp_path, _cache_path(cache_dir, params))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 def parse_date(date_str: str) -> datetime:
     """Parse a date string in YYYY-MM-DD format."""
     return datetime.strptime(date_str, "%Y-%m-%d")
 
 
-def fetch_satellite_vectors(
+def parse_vectors(result_text: str) -> tuple[array, array]:
+    """
+    Parse the $$SOE..$$EOE block of a Horizons CSV vector table.
+
+    Returns (jd, pos) as array('d')s: jd holds one Julian Date per point and
+    pos the matching positions flattened row-major as x, y, z (km), so
+    pos[3*i:3*i + 3] belongs to jd[i]. Rows look like:
+
+        2460000.500000000, A.D. 2023-Feb-25 00:00:00.0000,  1.234E+03,  5.678E+03,  9.012E+02,
+
+    Rather than splitting and converting line by line, the block is sliced out
+    with str.find, rows are joined into one comma-separated field list, and
+    each column is converted as a single strided slice.
+    """
+    if "\r" in result_text:
+        result_text = result_text.replace("\r", "")
+    soe = result_text.find("$$SOE")
+    # The data starts on the line after the $$SOE marker.
+    start = result_text.find("\n", soe) + 1 if soe >= 0 else 0
+    if not start:
+        raise RuntimeError("Horizons result has no $$SOE/$$EOE data block")
+    # Search from the newline that ends the $$SOE line so an empty block
+    # still matches; the slice then excludes both marker lines.
+    eoe = result_text.find("\n$$EOE", start - 1)
+    if eoe < 0:
+        raise RuntimeError("Horizons result has no $$SOE/$$EOE data block")
+    # strip() and the blank-line search return the block as-is (no copy)
+    # in the usual case where Horizons sent neither.
+    body = result_text[start:eoe].strip()
+    if _BLANK_LINE.search(body):
+        body = _BLANK_LINE.sub("\n", body)
+    if not body:
+        return array("d"), array("d")
+
+    # Fields per row, counted on the first row. The trailing comma Horizons
+    # emits shows up as an empty last field, which is simply never read.
+    first_row_end = body.find("\n")
+    ncols = body.count(",", 0, first_row_end if first_row_end >= 0 else len(body)) + 1
+    if ncols < 5:
+        raise RuntimeError(f"Unexpected Horizons CSV row: {body[:50]}...")
+
+    fields = body.replace("\n", ",").split(",")
+    if len(fields) % ncols:
+        raise RuntimeError("Horizons CSV block has rows of differing length")
+    count = len(fields) // ncols
+
+    pos = array("d", bytes(24 * count))
+    try:
+        # Columns: JDTDB, Calendar Date, X, Y, Z
+        jd = array("d", map(float, fields[0::ncols]))
+        for axis, in_col in enumerate((2, 3, 4)):
+            pos[axis::3] = array("d", map(float, fields[in_col::ncols]))
+    except ValueError as e:
+        raise RuntimeError(f"Could not parse Horizons CSV block ({e})") from e
+
+    return jd, pos
+
+
+def _horizons_time(t: datetime) -> str:
+    """Format a datetime as a quoted Horizons START_TIME/STOP_TIME value."""
+    return f"'{t.strftime('%Y-%m-%d %H:%M')}'"
+
+
+def _fetch_chunk(
     satellite_id: str,
     display_name: str,
     start: datetime,
     end: datetime,
-    step_minutes: int
-) -> list[dict]:
+    step_minutes: int,
+    cache_dir: Optional[Path] = None
+) -> tuple[array, array]:
     """
-    Fetch satellite position vectors from NASA Horizons.
+    Fetch one Horizons vector table for [start, end].
 
-    Returns a list of dicts with 'jd', 'x', 'y', 'z' in km (ECI J2000 frame).
+    Returns (jd, pos) as from parse_vectors(); both empty if the whole
+    interval lies past the end of Horizons' predicted trajectory. Raises
+    RuntimeError if the table does not have one point per step from start to
+    the (possibly clamped) stop time, e.g. because Horizons cut it short.
     """
     # Build the Horizons API request
     # We want vectors in the J2000 equatorial frame (ICRF), geocentric
@@ -105,14 +358,16 @@ def fetch_satellite_vectors(
         "VEC_CORR": "NONE",          # No light-time correction (we want geometric)
         "OUT_UNITS": "KM-S",         # Kilometers and seconds
         "CSV_FORMAT": "YES",
-        "START_TIME": start.strftime("%Y-%m-%d"),
-        "STOP_TIME": end.strftime("%Y-%m-%d"),
+        "START_TIME": _horizons_time(start),
+        "STOP_TIME": _horizons_time(end),
         "STEP_SIZE": f"{step_minutes}m",
     }
 
-    print(f"Fetching {display_name} ephemeris from {start} to {end} (step: {step_minutes} min)...")
-
-    data = _fetch_json(f"{HORIZONS_API_URL}?{urllib.parse.urlencode(params)}")
+    cached = _load_cached_vectors(params, cache_dir)
+    if cached is not None:
+        return cached
+    data = _query_horizons(params)
+    stop = end
 
     if "error" in data:
         # Predicted spacecraft trajectories only extend so far into the
@@ -126,8 +381,16 @@ def fetch_satellite_vectors(
             if clamped_end > start:
                 print(f"Horizons only has {display_name} ephemeris through "
                       f"{cutoff.date()}; clamping window to {clamped_end.date()}.")
-                params["STOP_TIME"] = clamped_end.strftime("%Y-%m-%d")
-                data = _fetch_json(f"{HORIZONS_API_URL}?{urllib.parse.urlencode(params)}")
+                params["STOP_TIME"] = _horizons_time(clamped_end)
+                stop = clamped_end
+                cached = _load_cached_vectors(params, cache_dir)
+                if cached is not None:
+                    return cached
+                data = _query_horizons(params)
+            else:
+                print(f"Skipping {start} to {end}: past Horizons' {display_name} "
+                      f"cutoff ({cutoff.date()}).")
+                return array("d"), array("d")
 
     if "error" in data:
         raise RuntimeError(f"Horizons API error: {data['error']}")
@@ -135,85 +398,213 @@ def fetch_satellite_vectors(
     if "result" not in data:
         raise RuntimeError("Unexpected API response format")
 
-    # Parse the result text
-    result_text = data["result"]
-
-    # Find the data section between $$SOE and $$EOE markers
-    lines = result_text.split("\n")
-    in_data = False
-    points = []
-
-    for line in lines:
-        line = line.strip()
-
-        if line == "$$SOE":
-            in_data = True
-            continue
-        elif line == "$$EOE":
-            break
-        elif in_data and line:
-            # Parse CSV line: JDTDB, Calendar Date, X, Y, Z
-            # Format: 2460000.500000000, A.D. 2023-Feb-25 00:00:00.0000,  1.234E+03,  5.678E+03,  9.012E+02,
-            parts = line.split(",")
-            if len(parts) >= 5:
-                try:
-                    jd = float(parts[0].strip())
-                    x = float(parts[2].strip())
-                    y = float(parts[3].strip())
-                    z = float(parts[4].strip())
-                    points.append({"jd": jd, "x": x, "y": y, "z": z})
-                except (ValueError, IndexError) as e:
-                    print(f"Warning: Could not parse line: {line[:50]}... ({e})")
-
-    print(f"Parsed {len(points)} ephemeris points")
-    return points
-
-
-def write_binary_ephemeris(points: list[dict], output_path: Path) -> None:
+    jd, pos = parse_vectors(data["result"])
+    # Horizons samples both ends of the window, so a table cut short at the
+    # tail is still evenly spaced; only the count gives it away.
+    expected = int((stop - start).total_seconds() // (step_minutes * 60)) + 1
+    if len(jd) != expected:
+        raise RuntimeError(f"Horizons returned {len(jd)} points for {start} to {stop}, "
+                           f"expected {expected} at {step_minutes}-minute steps")
+    _store_cached_vectors(params, cache_dir, jd, pos)
+    return jd, pos
+
+
+def check_sampling(jd: array, step_minutes: int) -> None:
+    """
+    Check that jd is strictly increasing with a uniform step_minutes spacing.
+
+    Raises RuntimeError naming the first offending sample, so that a dropped,
+    duplicated or reordered row (within a response or at a sub-query seam)
+    is caught before anything is written.
+    """
+    expected = step_minutes / 1440.0
+    for i, (a, b) in enumerate(zip(jd, jd[1:]), start=1):
+        if b <= a:
+            raise RuntimeError(f"Ephemeris JD not increasing at point {i}: {a:.9f} then {b:.9f}")
+        if abs(b - a - expected) > JD_STEP_TOLERANCE:
+            raise RuntimeError(f"Uneven ephemeris sampling at point {i}: step of "
+                               f"{(b - a) * 1440:.4f} min after JD {a:.9f}, "
+                               f"expected {step_minutes} min")
+
+
+def fetch_satellite_vectors(
+    satellite_id: str,
+    display_name: str,
+    start: datetime,
+    end: datetime,
+    step_minutes: int,
+    cache_dir: Optional[Path] = None
+) -> tuple[array, array]:
+    """
+    Fetch satellite position vectors from NASA Horizons.
+
+    Windows longer than MAX_POINTS_PER_QUERY points are split into
+    step-aligned sub-queries that are fetched concurrently and stitched back
+    together in order. If cache_dir is given, each sub-query's parsed vectors
+    are cached there (see _store_cached_vectors).
+
+    Returns (jd, pos) with positions in km (ECI J2000 frame); see
+    parse_vectors(). Raises RuntimeError if the stitched samples are not
+    evenly spaced (see check_sampling).
+    """
+    print(f"Fetching {display_name} ephemeris from {start} to {end} (step: {step_minutes} min)...")
+
+    # A sub-query of n steps returns n + 1 points, since both ends are
+    # sampled, so each one may span at most MAX_POINTS_PER_QUERY - 1 steps.
+    total_steps = int((end - start).total_seconds() / 60 / step_minutes)
+    n_chunks = max(1, math.ceil(total_steps / (MAX_POINTS_PER_QUERY - 1)))
+    chunk_span = timedelta(minutes=step_minutes * math.ceil(total_steps / n_chunks))
+
+    bounds = [start + i * chunk_span for i in range(n_chunks)] + [end]
+    if n_chunks > 1:
+        print(f"Splitting into {n_chunks} sub-queries of up to "
+              f"{MAX_POINTS_PER_QUERY:,} points...")
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(n_chunks, MAX_CONCURRENT_QUERIES)) as pool:
+            chunks = list(pool.map(
+                lambda i: _fetch_chunk(satellite_id, display_name,
+                                       bounds[i], bounds[i + 1], step_minutes, cache_dir),
+                range(n_chunks),
+            ))
+    finally:
+        _close_connections()
+
+    jd, pos = array("d"), array("d")
+    for chunk_jd, chunk_pos in chunks:
+        # Adjacent sub-queries share their boundary sample.
+        if jd and chunk_jd and chunk_jd[0] == jd[-1]:
+            chunk_jd, chunk_pos = chunk_jd[1:], chunk_pos[3:]
+        jd += chunk_jd
+        pos += chunk_pos
+
+    check_sampling(jd, step_minutes)
+    print(f"Parsed {len(jd)} ephemeris points")
+    return jd, pos
+
+
+def _le_bytes(values: array) -> memoryview:
+    """The little-endian bytes of an array, copying only on big-endian hosts."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return memoryview(values).cast("B")
+
+
+def _write_ephemeris(f: BinaryIO, jd: array, pos: array, fp32_pos: bool = False) -> None:
+    """Write the header and columns of an ephemeris to an open binary file."""
+    flags = FORMAT_SOA | (FORMAT_F32_POSITIONS if fp32_pos else 0)
+    f.write(_HEADER.pack(0, FORMAT_MAGIC, len(jd), flags))
+    f.write(_le_bytes(jd))
+    for axis in range(3):
+        column = pos[axis::3]
+        f.write(_le_bytes(array("f", column) if fp32_pos else column))
+
+
+def write_binary_ephemeris(jd: array, pos: array, output_path: Path,
+                           fp32_pos: bool = False) -> None:
     """
-    Write ephemeris data in binary format.
+    Write ephemeris data (jd and flattened x, y, z positions) in binary format.
 
     Format:
-        - count: u32 (little-endian)
-        - per point: jd (f64), x (f64), y (f64), z (f64) - all little-endian
+        - header: 0 (u32), FORMAT_MAGIC, count (u32), format flags (u8), 3 zero bytes
+        - columns: jd[] (f64), then x[], y[], z[] (f64, or f32 if fp32_pos)
+        - all little-endian
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_path, "wb") as f:
-        # Write header (count as u32)
-        f.write(struct.pack("<I", len(points)))
-
-        # Write each point
-        for p in points:
-            f.write(struct.pack("<dddd", p["jd"], p["x"], p["y"], p["z"]))
+        _write_ephemeris(f, jd, pos, fp32_pos)
 
     file_size = output_path.stat().st_size
-    print(f"Wrote {len(points)} points to {output_path} ({file_size:,} bytes)")
+    print(f"Wrote {len(jd)} points to {output_path} ({file_size:,} bytes)")
 
 
-def verify_binary_ephemeris(path: Path, orbital_altitude: int) -> None:
-    """Verify the binary ephemeris file by reading it back."""
+def read_binary_ephemeris(path: Path) -> tuple[array, array]:
+    """Read a binary ephemeris file (any supported format) into (jd, pos) arrays."""
     with open(path, "rb") as f:
-        count = struct.unpack("<I", f.read(4))[0]
-        print(f"\nVerification: {count} points in file")
+        # mmap refuses empty files, so check before mapping.
+        size = os.fstat(f.fileno()).st_size
+        if size < _LEGACY_HEADER.size:
+            raise RuntimeError(f"{path} is too short ({size} bytes) for an ephemeris header")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mm:
+        count = _LEGACY_HEADER.unpack_from(mm, 0)[0]
+        if count == 0 and len(mm) >= _HEADER.size and mm[4:8] == FORMAT_MAGIC:
+            _, _, count, flags = _HEADER.unpack_from(mm, 0)
+            offset = _HEADER.size
+        else:
+            # Written before the header existed.
+            flags, offset = 0, _LEGACY_HEADER.size
+        if flags & ~(FORMAT_F32_POSITIONS | FORMAT_SOA):
+            raise RuntimeError(f"{path} has unknown format flags {flags:#04x}")
+
+        point = _POINT_F32 if flags & FORMAT_F32_POSITIONS else _POINT
+        expected_size = offset + count * point.size
+        if len(mm) != expected_size:
+            raise RuntimeError(f"{path} is {len(mm):,} bytes; header count implies "
+                               f"{expected_size:,}")
+
+        with memoryview(mm) as view, view[offset:expected_size] as data:
+            if flags & FORMAT_SOA:
+                pos_code = "f" if flags & FORMAT_F32_POSITIONS else "d"
+                columns, start = [], 0
+                for typecode in ("d", pos_code, pos_code, pos_code):
+                    column = array(typecode)
+                    column.frombytes(data[start:start + count * column.itemsize])
+                    if sys.byteorder == "big":
+                        column.byteswap()
+                    columns.append(column)
+                    start += count * column.itemsize
+            else:
+                columns = [array("d", c) for c in zip(*point.iter_unpack(data))]
+
+    if not count:
+        return array("d"), array("d")
+    pos = array("d", bytes(24 * count))
+    for axis in range(3):
+        pos[axis::3] = array("d", columns[axis + 1])
+    return columns[0], pos
+
+
+def verify_ephemeris(jd: array, pos: array, orbital_altitude: int, full_scan: bool = False) -> None:
+    """
+    Sanity-check ephemeris data by printing its first and last points.
+
+    With full_scan, every point is checked rather than just the first and
+    last, and the geocentric radius range is reported — a cheap way to catch
+    a response Horizons truncated or garbled without saying so.
+    """
+    count = len(jd)
+    print(f"\nVerification: {count} points")
 
-        if count > 0:
-            # Read first point
-            jd, x, y, z = struct.unpack("<dddd", f.read(32))
-            r = (x*x + y*y + z*z) ** 0.5
-            print(f"  First point: JD {jd:.6f}, pos=({x:.1f}, {y:.1f}, {z:.1f}) km, r={r:.1f} km")
+    if count > 0:
+        x, y, z = pos[0:3]
+        r = math.hypot(x, y, z)
+        print(f"  First point: JD {jd[0]:.6f}, pos=({x:.1f}, {y:.1f}, {z:.1f}) km, r={r:.1f} km")
 
-            # Read last point
-            if count > 1:
-                f.seek(4 + (count - 1) * 32)
-                jd, x, y, z = struct.unpack("<dddd", f.read(32))
-                r = (x*x + y*y + z*z) ** 0.5
-                print(f"  Last point:  JD {jd:.6f}, pos=({x:.1f}, {y:.1f}, {z:.1f}) km, r={r:.1f} km")
+        if count > 1:
+            x, y, z = pos[-3:]
+            r = math.hypot(x, y, z)
+            print(f"  Last point:  JD {jd[-1]:.6f}, pos=({x:.1f}, {y:.1f}, {z:.1f}) km, r={r:.1f} km")
 
-            # Print orbital info
-            print(f"\nExpected orbital altitude: ~{orbital_altitude} km above Earth's surface")
-            actual_altitude = r - 6378
-            print(f"Actual orbital altitude:   ~{actual_altitude:.0f} km")
+        if full_scan:
+            radii = list(map(math.hypot, pos[0::3], pos[1::3], pos[2::3]))
+            r_min, r_max = min(radii), max(radii)
+            print(f"  All points:  r={r_min:.1f}..{r_max:.1f} km, mean altitude "
+                  f"{sum(radii) / count - EARTH_RADIUS_KM:.0f} km")
+
+        # Print orbital info
+        print(f"\nExpected orbital altitude: ~{orbital_altitude} km above Earth's surface")
+        actual_altitude = r - EARTH_RADIUS_KM
+        print(f"Actual orbital altitude:   ~{actual_altitude:.0f} km")
+
+
+def verify_binary_ephemeris(path: Path, orbital_altitude: int, full_scan: bool = False) -> None:
+    """Verify a binary ephemeris file on disk (used by --verify-only)."""
+    jd, pos = read_binary_ephemeris(path)
+    print(f"\nRead {len(jd)} points from {path}")
+    verify_ephemeris(jd, pos, orbital_altitude, full_scan)
 
 
 def main():
@@ -249,6 +640,27 @@ def main():
         default=1,
         help="Time step in minutes, default: 1"
     )
+    parser.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Verify the existing --output file instead of fetching"
+    )
+    parser.add_argument(
+        "--verify-all",
+        action="store_true",
+        help="Check every written point, not just the first and last"
+    )
+    parser.add_argument(
+        "--fp32-pos",
+        action="store_true",
+        help="Store positions as f32 (20 bytes/point instead of 32)"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse (and store) parsed Horizons results in {DEFAULT_CACHE_DIR}; "
+             "entries never expire, so only use this while iterating locally"
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -265,6 +677,14 @@ def main():
     if args.output is None:
         args.output = Path(f"data/{args.satellite}_ephemeris.bin")
 
+    if args.verify_only:
+        try:
+            verify_binary_ephemeris(args.output, orbital_alt, args.verify_all)
+        except (OSError, RuntimeError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
+
     # Validate dates
     if args.end <= args.start:
         print("Error: End date must be after start date")
@@ -275,30 +695,24 @@ def main():
     expected_points = int(duration_minutes / args.step) + 1
     print(f"Expected ~{expected_points:,} points for {duration_minutes/60/24:.1f} days at {args.step} min intervals")
 
-    # Horizons has limits on query size - for large ranges we may need to chunk
-    if expected_points > 90000:
-        print(f"Warning: Large query ({expected_points} points). Horizons may limit results.")
-        print("Consider using a larger step size or shorter date range.")
-
     try:
         # Fetch ephemeris from Horizons
-        points = fetch_satellite_vectors(sat_id, display_name, args.start, args.end, args.step)
+        cache_dir = DEFAULT_CACHE_DIR if args.cache else None
+        jd, pos = fetch_satellite_vectors(sat_id, display_name, args.start, args.end,
+                                          args.step, cache_dir)
 
-        if not points:
+        if not jd:
             print("Error: No ephemeris points received")
             sys.exit(1)
 
         # Write binary file
-        write_binary_ephemeris(points, args.output)
+        write_binary_ephemeris(jd, pos, args.output, args.fp32_pos)
 
-        # Verify the output
-        verify_binary_ephemeris(args.output, orbital_alt)
+        # Verify what was written, from memory rather than re-reading the file
+        verify_ephemeris(jd, pos, orbital_alt, args.verify_all)
 
         print("\nDone!")
 
-    except urllib.error.URLError as e:
-        print(f"Error fetching from Horizons: {e}")
-        sys.exit(1)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)